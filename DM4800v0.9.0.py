@@ -10,9 +10,12 @@ import sys
 import csv
 import json
 import datetime
+import threading
 from dataclasses import dataclass
 from typing import Dict, Tuple, Optional, List
 from collections import deque
+from contextlib import contextmanager
+from functools import lru_cache
 from PyQt5 import QtCore, QtGui, QtWidgets
 from PyQt5.QtGui import QDesktopServices
 import mido
@@ -43,6 +46,9 @@ FADER_ZERO_DB_CC = 102
 MASTER_ZERO_DB_CC = 127
 MASTER_UI_MAX_CC = 140  # Allow fader to go above 0dB in UI for cap visibility
 PAN_CENTER_COLOR = "#00ff00"  # Default value - actual color managed by ColorThemeManager
+# Pan display text for every CC value: "L64".."L1", "C", "R1".."R63"
+PAN_LABELS = tuple("C" if v == PAN_CENTER_CC else (f"L{PAN_CENTER_CC - v}" if v < PAN_CENTER_CC else f"R{v - PAN_CENTER_CC}")
+                   for v in range(128))
 
 MAX_SCRIBBLE_LENGTH = 24
 MAX_SCRIBBLE_CHARS_PER_ROW = 14
@@ -50,6 +56,7 @@ DEFAULT_SCRIBBLE_TEXT = "-"
 MAX_MONO_STEREO_LENGTH = 8
 DEFAULT_MONO_STEREO_TEXT = "Mono"
 MAX_MIDI_MESSAGES = 1000
+_MISSING = object()  # dict.get() default for "no saved value", since None/False/0 are valid values
 
 import os
 import sys
@@ -557,6 +564,7 @@ class MidiMapping:
     midi_channel: int
     cc_number: int
 
+@lru_cache(maxsize=256)
 def parse_section_and_number(s: str) -> Tuple[str, int]:
     raw = s.strip().lower()
     if raw.startswith("channel"):
@@ -1538,6 +1546,9 @@ class ContextColorMenu(QtWidgets.QMenu):
         color_action = QtWidgets.QAction(f"Change Background ({current_color})", self)
         color_action.triggered.connect(self._change_background_color)
         self.addAction(color_action)
+        # The main window keeps this menu around, so refresh the current colour each time it opens
+        self._background_action = color_action
+        self.aboutToShow.connect(self._refresh_background_label)
         
         self.addSeparator()
         
@@ -1558,6 +1569,9 @@ class ContextColorMenu(QtWidgets.QMenu):
             action.triggered.connect(lambda checked, c=color: self.color_manager.set_background_color(c))
             themes_menu.addAction(action)
     
+    def _refresh_background_label(self):
+        self._background_action.setText(f"Change Background ({self.color_manager.get_background_color()})")
+
     def _change_fader_color(self):
         """Open color picker for fader color"""
         current_color = QtGui.QColor(self.color_manager.get_fader_zero_db_color())
@@ -1622,6 +1636,14 @@ class MidiMonitorWindow(QtWidgets.QWidget):
         self.text_area.setFont(QtGui.QFont("Courier New", 9))
         layout.addWidget(self.text_area)
         
+    @QtCore.pyqtSlot(int, int, int)
+    def add_incoming(self, channel: int, cc: int, value: int):
+        self.add_message("IN ", channel, cc, value)
+
+    @QtCore.pyqtSlot(int, int, int)
+    def add_outgoing(self, channel: int, cc: int, value: int):
+        self.add_message("OUT", channel, cc, value)
+
     def add_message(self, direction: str, channel: int, cc: int, value: int):
         timestamp = datetime.now().strftime("%H:%M:%S.%f")[:-3]
         message = f"{timestamp} {direction:3} Ch:{channel:2d} CC:{cc:3d} Val:{value:3d}"
@@ -1701,6 +1723,11 @@ class MonoStereoManager:
         self.csv_file = csv_file
         self.mono_stereo_data: Dict[str, str] = {}
         self.stereo_pairs: Dict[str, str] = {}
+        # Derived from stereo_pairs by _detect_stereo_pairs so the per-strip queries are plain lookups
+        self._stereo_left = set()
+        self._stereo_right = set()
+        self._partner_numbers: Dict[str, int] = {}
+        self._layouts: Dict[Tuple[str, int], List[Tuple[str, int, Optional[int]]]] = {}
         self.load_mono_stereo_data()
 
     def _generate_default_data(self) -> Dict[str, str]:
@@ -1763,6 +1790,10 @@ class MonoStereoManager:
 
     def _detect_stereo_pairs(self):
         self.stereo_pairs = {}
+        self._stereo_left = set()
+        self._stereo_right = set()
+        self._partner_numbers = {}
+        self._layouts = {}
         for section in ["Channel", "Bus", "Aux"]:
             max_num = {"Channel": 64, "Bus": 24, "Aux": 12}[section]
             for i in range(1, max_num + 1, 2):
@@ -1771,6 +1802,10 @@ class MonoStereoManager:
                 if (self.mono_stereo_data.get(odd_key, "").lower() == "stereo" and i + 1 <= max_num):
                     self.stereo_pairs[odd_key] = even_key
                     self.stereo_pairs[even_key] = odd_key
+                    self._stereo_left.add(odd_key)
+                    self._stereo_right.add(even_key)
+                    self._partner_numbers[odd_key] = i + 1
+                    self._partner_numbers[even_key] = i
 
     def is_stereo_pair(self, key: str) -> bool:
         return key in self.stereo_pairs
@@ -1779,24 +1814,26 @@ class MonoStereoManager:
         return self.stereo_pairs.get(key)
 
     def is_stereo_left(self, key: str) -> bool:
-        if key not in self.stereo_pairs:
-            return False
-        try:
-            parts = key.split()
-            number = int(parts[1])
-            return number % 2 == 1
-        except:
-            return False
+        return key in self._stereo_left
+
+    def layout_for_section(self, prefix: str, count: int) -> List[Tuple[str, int, Optional[int]]]:
+        """Display order for a section's strips: ("mono", n, None) or ("stereo", left, right).
+        
+        A stereo pair is a single entry under its left (odd) number. Cached until the pairs are re-detected."""
+        layout = self._layouts.get((prefix, count))
+        if layout is None:
+            layout = []
+            for i in range(1, count + 1):
+                key = f"{prefix} {i}"
+                if key in self._stereo_left:
+                    layout.append(("stereo", i, self._partner_numbers[key]))
+                elif key not in self._stereo_right:
+                    layout.append(("mono", i, None))
+            self._layouts[(prefix, count)] = layout
+        return layout
 
     def is_stereo_right(self, key: str) -> bool:
-        if key not in self.stereo_pairs:
-            return False
-        try:
-            parts = key.split()
-            number = int(parts[1])
-            return number % 2 == 0
-        except:
-            return False
+        return key in self._stereo_right
 
 class ScribbleStripManager:
     def __init__(self, csv_file: str = SCRIBBLE_CSV):
@@ -1863,10 +1900,19 @@ class ScribbleStripManager:
     def get_scribble_text(self, key: str) -> str:
         return self.scribble_data.get(key, DEFAULT_SCRIBBLE_TEXT)
 
-    def set_scribble_text(self, key: str, value: str):
+    def all_texts(self) -> Dict[str, str]:
+        """The live key -> text map, for bulk reads; use get/set_scribble_text to modify"""
+        return self.scribble_data
+
+    def set_scribble_text(self, key: str, value: str, save: bool = True) -> bool:
+        """Store the text; returns False without touching the file if it is unchanged"""
         value = value[:MAX_SCRIBBLE_LENGTH] if len(value) > MAX_SCRIBBLE_LENGTH else value
+        if self.scribble_data.get(key) == value:
+            return False
         self.scribble_data[key] = value
-        self.save_scribble_data()
+        if save:
+            self.save_scribble_data()
+        return True
 
 class MidiManager(QtCore.QObject):
     midi_message_received = QtCore.pyqtSignal(int, int, int)
@@ -1876,6 +1922,8 @@ class MidiManager(QtCore.QObject):
         super().__init__()
         self._inport: Optional[mido.ports.BaseInput] = None
         self._outport: Optional[mido.ports.BaseOutput] = None
+        # send_cc runs on the MIDI send thread, so the output port is only touched under this lock
+        self._out_lock = threading.Lock()
         self.current_in_port = ""
         self.current_out_port = ""
 
@@ -1903,13 +1951,16 @@ class MidiManager(QtCore.QObject):
         return False
 
     def open_output(self, output_name: str) -> bool:
-        if self._outport:
-            self._outport.close()
-            self._outport = None
+        with self._out_lock:
+            if self._outport:
+                self._outport.close()
+                self._outport = None
         
         if output_name:
             try:
-                self._outport = mido.open_output(output_name)
+                outport = mido.open_output(output_name)
+                with self._out_lock:
+                    self._outport = outport
                 self.current_out_port = output_name
                 print(f"Opened MIDI output: {output_name}")
                 return True
@@ -1924,23 +1975,64 @@ class MidiManager(QtCore.QObject):
             self._inport.close()
             self._inport = None
             self.current_in_port = ""
-        if self._outport:
-            self._outport.close()
-            self._outport = None
-            self.current_out_port = ""
+        with self._out_lock:
+            if self._outport:
+                self._outport.close()
+                self._outport = None
+                self.current_out_port = ""
 
     def _mido_callback(self, msg: mido.Message):
+        # Called on mido's input thread; receivers are connected with QueuedConnection
         if msg.type == 'control_change':
             self.midi_message_received.emit(msg.channel + 1, msg.control, msg.value)
 
     def send_cc(self, channel_1: int, cc: int, value: int):
-        if not self._outport:
-            return
         ch0 = max(0, min(15, channel_1 - 1))
         val = max(0, min(127, int(value)))
-        self._outport.send(mido.Message('control_change', channel=ch0, control=int(cc), value=val))
+        with self._out_lock:
+            if not self._outport:
+                return
+            self._outport.send(mido.Message('control_change', channel=ch0, control=int(cc), value=val))
         self.midi_message_sent.emit(channel_1, cc, val)
 
+class MidiSendWorker(QtCore.QObject):
+    """Sends CC messages for the UI on its own thread.
+    
+    Requests arriving within a millisecond of each other are coalesced per (channel, cc), so a
+    fader drag sends the latest position instead of every intermediate one."""
+
+    def __init__(self, midi: MidiManager):
+        super().__init__()
+        self.midi = midi
+        self._send_cc = midi.send_cc  # Bound once; flush calls it for every pending CC
+        self._pending: Dict[Tuple[int, int], int] = {}
+        # Parented to the worker so it moves to the worker thread along with it
+        self._flush_timer = QtCore.QTimer(self)
+        self._flush_timer.setSingleShot(True)
+        self._flush_timer.setInterval(1)
+        self._flush_timer.timeout.connect(self.flush)
+
+    @QtCore.pyqtSlot(object)
+    def send_batch(self, batch: Dict[Tuple[int, int], int]):
+        """Take one event loop tick's worth of UI sends, keyed by (channel, cc)"""
+        self._pending.update(batch)
+        if not self._flush_timer.isActive():
+            self._flush_timer.start()
+
+    @QtCore.pyqtSlot()
+    def flush_and_stop(self):
+        """Send what is pending, then end the worker thread's event loop"""
+        self.flush()
+        self.thread().quit()
+
+    @QtCore.pyqtSlot()
+    def flush(self):
+        self._flush_timer.stop()
+        pending, self._pending = self._pending, {}
+        send_cc = self._send_cc
+        for (channel_1, cc), value in pending.items():
+            send_cc(channel_1, cc, value)
+
 class ScribbleStripTextEdit(QtWidgets.QTextEdit):
     textCommitted = QtCore.pyqtSignal(str)
 
@@ -2044,7 +2136,77 @@ class ScaleWidget(QtWidgets.QWidget):
                 short_label = label.replace(" dB", "")  # Remove " dB" from labels
     
             painter.drawText(text_rect, QtCore.Qt.AlignRight | QtCore.Qt.AlignVCenter, short_label)
-            
+
+class WideStereoScale(ScaleWidget):
+    """Scale used by wide stereo strips - label positions are cached per size instead of recomputed on every paint"""
+
+    def __init__(self, is_master=False, parent=None):
+        super().__init__(is_master=is_master, parent=parent)
+        self._rect = QtCore.QRect()
+        self._text_rect = QtCore.QRect()
+        self._label_cache: List[Tuple[int, str]] = []
+        self._ticks_path = QtGui.QPainterPath()
+        # Cache is rebuilt on the next paint, so strips that are never shown never build it
+        self._cache_dirty = True
+        self._pen_grid = QtGui.QPen(QtCore.Qt.gray, 1)
+        self._pen_text = QtGui.QPen(QtCore.Qt.black, 1)
+        self._font = QtGui.QFont(self.font())
+        self._font.setPointSizeF(max(7.0, BASE_SMALL_FONT * self.font_scale))
+
+    def set_scale(self, s: float):
+        if s != self.font_scale:
+            self._font.setPointSizeF(max(7.0, BASE_SMALL_FONT * s))
+        super().set_scale(s)
+
+    @staticmethod
+    def _short_label(label: str) -> str:
+        """Remove "dB" text, keeping the + sign and the -∞ marker"""
+        if "+" in label:
+            return label.replace(" dB", "")
+        if "-∞" in label or "-âˆž" in label:
+            return "-∞"
+        return label.replace(" dB", "")
+
+    def resizeEvent(self, event: QtGui.QResizeEvent):
+        super().resizeEvent(event)
+        self._cache_dirty = True
+
+    def _rebuild_label_cache(self):
+        rect = self.rect().adjusted(6, 6, -6, -6)
+        scale_points = MASTER_DB_POINTS if self.is_master else CHANNEL_DB_POINTS
+        self._rect = rect
+        # Add 3px downward offset for wide stereo strip alignment
+        self._label_cache = [
+            (int(rect.top() + (1.0 - cc / 127.0) * rect.height()) + 3, self._short_label(label))
+            for cc, label in scale_points
+        ]
+        # All tick marks share one pen, so they are drawn as a single path
+        ticks = QtGui.QPainterPath()
+        for y, _ in self._label_cache:
+            ticks.moveTo(rect.right()-6, y)
+            ticks.lineTo(rect.right()-2, y)
+        self._ticks_path = ticks
+        self._cache_dirty = False
+
+    def paintEvent(self, event: QtGui.QPaintEvent):
+        if self._cache_dirty:
+            self._rebuild_label_cache()
+        painter = QtGui.QPainter(self)
+        rect = self._rect
+        text_rect = self._text_rect
+        painter.setRenderHint(QtGui.QPainter.Antialiasing, True)
+
+        painter.setPen(self._pen_grid)
+        painter.drawLine(rect.right()-2, rect.top(), rect.right()-2, rect.bottom())
+
+        painter.setPen(self._pen_text)
+        painter.drawPath(self._ticks_path)
+        painter.setFont(self._font)
+
+        for y, short_label in self._label_cache:
+            text_rect.setRect(rect.left(), y-8, rect.width()-8, 16)
+            painter.drawText(text_rect, QtCore.Qt.AlignRight | QtCore.Qt.AlignVCenter, short_label)
+
 class CustomFaderSlider(QtWidgets.QSlider):
     doubleClicked = QtCore.pyqtSignal()
 
@@ -2210,7 +2372,7 @@ class CustomFaderSlider(QtWidgets.QSlider):
 class FaderWithScale(QtWidgets.QWidget):
     valueChanged = QtCore.pyqtSignal(int)
 
-    def __init__(self, initial=FADER_ZERO_DB_CC, h_scale=1.0, v_scale=1.0, is_master=False, is_stereo=False, parent=None):
+    def __init__(self, initial=FADER_ZERO_DB_CC, h_scale=1.0, v_scale=1.0, is_master=False, is_stereo=False, wide_stereo=False, parent=None):
         super().__init__(parent)
         self.h_scale_factor = h_scale
         self.v_scale_factor = v_scale
@@ -2219,7 +2381,10 @@ class FaderWithScale(QtWidgets.QWidget):
         self.slider = CustomFaderSlider(is_master=is_master, is_stereo=is_stereo)
         self.slider.setValue(initial)
 
-        self.scale = ScaleWidget(is_master=is_master)
+        if wide_stereo:
+            self.scale = WideStereoScale(is_master=is_master)
+        else:
+            self.scale = ScaleWidget(is_master=is_master)
         # Make scale even narrower 
         self.scale.setMinimumWidth(32)  # Keep scale readable
 
@@ -2247,6 +2412,7 @@ class FaderWithScale(QtWidgets.QWidget):
         self.apply_scale(self.h_scale_factor, self.v_scale_factor)
         self.slider.update_color(initial)
 
+    @QtCore.pyqtSlot(int)
     def _on_value_changed(self, value):
         self.slider.update_color(value)
         # For master fader, constrain MIDI output to 0dB max (127) even if UI goes higher
@@ -2261,13 +2427,12 @@ class FaderWithScale(QtWidgets.QWidget):
         self.slider.setValue(zero_db_value)
 
     def setValue(self, v: int):
-        self.slider.blockSignals(True)
-        if self.is_master:
-            # Allow master fader UI to go up to MASTER_UI_MAX_CC for cap visibility
-            self.slider.setValue(int(max(0, min(MASTER_UI_MAX_CC, v))))
-        else:
-            self.slider.setValue(int(max(0, min(127, v))))
-        self.slider.blockSignals(False)
+        with QtCore.QSignalBlocker(self.slider):
+            if self.is_master:
+                # Allow master fader UI to go up to MASTER_UI_MAX_CC for cap visibility
+                self.slider.setValue(int(max(0, min(MASTER_UI_MAX_CC, v))))
+            else:
+                self.slider.setValue(int(max(0, min(127, v))))
         self.slider.update_color(v)
 
     def value(self) -> int:
@@ -2426,6 +2591,7 @@ class MuteButton(QtWidgets.QPushButton):
         self.update_style()
         self.toggled.connect(self._on_toggled)
 
+    @QtCore.pyqtSlot(bool)
     def _on_toggled(self, on: bool):
         self.update_style()
         self.toggledCC.emit(127 if on else 0)
@@ -2441,13 +2607,14 @@ class MuteButton(QtWidgets.QPushButton):
 
     def set_from_cc(self, value: int):
         on = (value >= 64)
-        self.blockSignals(True)
-        self.setChecked(on)
-        self.blockSignals(False)
+        with QtCore.QSignalBlocker(self):
+            self.setChecked(on)
         self.update_style()
 
 class ChannelStrip(QtWidgets.QFrame):
     scribbleTextChanged = QtCore.pyqtSignal(str, str)
+    STRIP_KIND = "mono"
+    STEREO_HALF_KIND = "stereo_half"
 
     def __init__(self, title: str, scribble_key: str = "", has_pan: bool=True, has_mute: bool=True, has_scribble: bool=True, h_scale: float=1.0, v_scale: float=1.0, is_master: bool=False, mono_stereo_manager=None, is_stereo_pair: bool=False, stereo_partner_num: int=0, parent=None):
         super().__init__(parent)
@@ -2456,11 +2623,23 @@ class ChannelStrip(QtWidgets.QFrame):
         self.is_master = is_master
         self.is_stereo_pair = is_stereo_pair
         self.stereo_partner_num = stereo_partner_num
+        # What MixerWindow dispatches wiring and state saving on
+        self.strip_kind = self.STEREO_HALF_KIND if is_stereo_pair else self.STRIP_KIND
         self.scribble_key = scribble_key
         self.mono_stereo_manager = mono_stereo_manager
         self.stereo_partner_strip = None
         self.setFrameShape(QtWidgets.QFrame.StyledPanel)
 
+        # Partner fader/pan updates are coalesced so a fast drag only syncs the latest value
+        self._pending_partner_fader = None
+        self._pending_partner_pan = None
+        self._sync_timer = QtCore.QTimer(self)
+        self._sync_timer.setSingleShot(True)
+        self._sync_timer.setInterval(0)
+        self._sync_timer.timeout.connect(self._flush_partner_sync)
+        # Set while a partner is pushing values into this strip, so they are never bounced back
+        self._syncing = False
+
         display_title = title
         title_color = "black"
         
@@ -2562,43 +2741,26 @@ class ChannelStrip(QtWidgets.QFrame):
     #def set_stereo_partner(self, partner_strip): DUPLICATE OF ROW 949
     #    self.stereo_partner_strip = partner_strip
 
-    def mirror_from_partner(self, control_type: str, value: int):
-        if control_type == "fader":
-            self.fader.setValue(value)
-        elif control_type == "pan" and self.pan:
-            self.pan.blockSignals(True)
-            self.pan.setValue(value)
-            self.pan.blockSignals(False)
-            self._on_pan_changed(value)
-        elif control_type == "mute" and self.mute:
-            self.mute.set_from_cc(value)
-
-    def sync_to_partner(self, control_type: str, value: int):
-        if self.stereo_partner_strip:
-            self.stereo_partner_strip.mirror_from_partner(control_type, value)
-
     def set_scribble_text(self, text: str):
-        if self.scribble:
-            self.scribble.blockSignals(True)
+        # getText() drops the display line break, so it compares equal to the stored text
+        if self.scribble is None or self.scribble.getText() == text:
+            return
+        with QtCore.QSignalBlocker(self.scribble):
             self.scribble.setText(text)
-            self.scribble.blockSignals(False)
 
     def _on_scribble_changed(self, new_text: str):
         if self.scribble_key:
             self.scribbleTextChanged.emit(self.scribble_key, new_text)
 
+    @QtCore.pyqtSlot(int)
     def _on_pan_changed(self, v: int):
-        if self.pan_value:
-            if v == PAN_CENTER_CC:
-                self.pan_value.setText("C")
-            elif v < PAN_CENTER_CC:
-                self.pan_value.setText(f"L{PAN_CENTER_CC - v}")
-            else:
-                self.pan_value.setText(f"R{v - PAN_CENTER_CC}")
+        if self.pan_value and 0 <= v < len(PAN_LABELS):
+            self.pan_value.setText(PAN_LABELS[v])
 
         if self.pan:
             self.pan.update_color(v)
 
+    @QtCore.pyqtSlot()
     def _pan_reset(self):
         if self.pan:
             self.pan.setValue(PAN_CENTER_CC)
@@ -2649,51 +2811,54 @@ class ChannelStrip(QtWidgets.QFrame):
         """Set the stereo partner strip for synchronized control"""
         self.stereo_partner_strip = partner_strip
 
+    @QtCore.pyqtSlot(int)
     def _sync_fader_to_partner(self, value: int):
-        """Update partner's fader without triggering signals"""
-        if self.stereo_partner_strip and hasattr(self.stereo_partner_strip, 'fader'):
-            self.stereo_partner_strip.fader.blockSignals(True)
-            self.stereo_partner_strip.fader.setValue(value)
-            self.stereo_partner_strip.fader.blockSignals(False)
+        """Queue the fader value for the partner - only the latest value is applied on the next event loop pass"""
+        if self._syncing:
+            return
+        self._pending_partner_fader = value
+        if not self._sync_timer.isActive():
+            self._sync_timer.start()
 
+    @QtCore.pyqtSlot(int)
     def _sync_pan_to_partner(self, value: int):
-        """Update partner's pan without triggering signals"""
-        if self.stereo_partner_strip and hasattr(self.stereo_partner_strip, 'pan') and self.stereo_partner_strip.pan:
-            self.stereo_partner_strip.pan.blockSignals(True)
-            self.stereo_partner_strip.pan.setValue(value)
-            self.stereo_partner_strip.pan.blockSignals(False)
-            self.stereo_partner_strip._on_pan_changed(value)
+        """Queue the pan value for the partner - only the latest value is applied on the next event loop pass"""
+        if self._syncing:
+            return
+        self._pending_partner_pan = value
+        if not self._sync_timer.isActive():
+            self._sync_timer.start()
+
+    @QtCore.pyqtSlot()
+    def _flush_partner_sync(self):
+        """Apply the latest queued fader/pan values to the partner without triggering signals"""
+        fader_value, self._pending_partner_fader = self._pending_partner_fader, None
+        pan_value, self._pending_partner_pan = self._pending_partner_pan, None
+        partner = self.stereo_partner_strip
+        if not partner:
+            return
 
-    def _sync_mute_to_partner(self, is_muted: bool):
-        """Update partner's mute without triggering signals"""
-        if self.stereo_partner_strip and hasattr(self.stereo_partner_strip, 'mute') and self.stereo_partner_strip.mute:
-            self.stereo_partner_strip.mute.blockSignals(True)
-            self.stereo_partner_strip.mute.setChecked(is_muted)
-            self.stereo_partner_strip.mute.blockSignals(False)
-            self.stereo_partner_strip.mute.update_style()
-    
-    def _sync_fader_to_partner(self, value: int):
-        """Update partner's fader without triggering signals"""
-        if self.stereo_partner_strip and hasattr(self.stereo_partner_strip, 'fader'):
-            self.stereo_partner_strip.fader.blockSignals(True)
-            self.stereo_partner_strip.fader.setValue(value)
-            self.stereo_partner_strip.fader.blockSignals(False)
+        partner._syncing = True
+        try:
+            if fader_value is not None and partner.fader.value() != fader_value:
+                partner.fader.setValue(fader_value)
 
-    def _sync_pan_to_partner(self, value: int):
-        """Update partner's pan without triggering signals"""
-        if self.stereo_partner_strip and hasattr(self.stereo_partner_strip, 'pan') and self.stereo_partner_strip.pan:
-            self.stereo_partner_strip.pan.blockSignals(True)
-            self.stereo_partner_strip.pan.setValue(value)
-            self.stereo_partner_strip.pan.blockSignals(False)
-            self.stereo_partner_strip._on_pan_changed(value)
+            if pan_value is not None and partner.pan and partner.pan.value() != pan_value:
+                with QtCore.QSignalBlocker(partner.pan):
+                    partner.pan.setValue(pan_value)
+                partner._on_pan_changed(pan_value)
+        finally:
+            partner._syncing = False
 
+    @QtCore.pyqtSlot(bool)
     def _sync_mute_to_partner(self, is_muted: bool):
         """Update partner's mute without triggering signals"""
-        if self.stereo_partner_strip and hasattr(self.stereo_partner_strip, 'mute') and self.stereo_partner_strip.mute:
-            self.stereo_partner_strip.mute.blockSignals(True)
-            self.stereo_partner_strip.mute.setChecked(is_muted)
-            self.stereo_partner_strip.mute.blockSignals(False)
-            self.stereo_partner_strip.mute.update_style()
+        partner = self.stereo_partner_strip
+        if self._syncing or not partner or not partner.mute or partner.mute.isChecked() == is_muted:
+            return
+        with QtCore.QSignalBlocker(partner.mute):
+            partner.mute.setChecked(is_muted)
+        partner.mute.update_style()
     
     def get_fader_value(self) -> int:
         """Get the current fader value"""
@@ -2720,21 +2885,32 @@ class ChannelStrip(QtWidgets.QFrame):
         """Set the mute state"""
         if self.mute:
             self.mute.setChecked(on)
+
+    def set_mute_from_cc(self, value: int):
+        """Set the mute state from a received CC value"""
+        self.set_mute_value(value >= 64)
     
     
 class WideStereoStrip(QtWidgets.QFrame):
     """Wide stereo channel strip that combines two channels into a single wide control strip"""
     scribbleTextChanged = QtCore.pyqtSignal(str, str)
+    STRIP_KIND = "wide_stereo"
+    # Not one half of a linked pair - same defaults a mono ChannelStrip has
+    is_stereo_pair = False
+    stereo_partner_num = 0
+    stereo_partner_strip = None
 
     def __init__(self, title: str, left_scribble_key: str = "", right_scribble_key: str = "", 
                  section_type: str = "channel", left_num: int = 1, right_num: int = 2,
                  has_pan: bool=True, has_mute: bool=True, has_scribble: bool=True, 
                  h_scale: float=1.0, v_scale: float=1.0, mono_stereo_manager=None, parent=None):
         super().__init__(parent)
+        self.strip_kind = self.STRIP_KIND
         self.h_scale_factor = h_scale
         self.v_scale_factor = v_scale
         self.left_scribble_key = left_scribble_key
         self.right_scribble_key = right_scribble_key
+        self.scribble_key = left_scribble_key  # The wide strip shows the left channel's scribble
         self.section_type = section_type
         self.left_num = left_num
         self.right_num = right_num
@@ -2841,7 +3017,8 @@ class WideStereoStrip(QtWidgets.QFrame):
         # Use your existing fader - we'll make it wider in apply_scale  
         self.v.addSpacing(5)  # Add gap before fader to match ChannelStrip
         self.fader = FaderWithScale(initial=FADER_ZERO_DB_CC, h_scale=self.h_scale_factor, 
-                                  v_scale=self.v_scale_factor, is_master=False, is_stereo=True)
+                                  v_scale=self.v_scale_factor, is_master=False, is_stereo=True,
+                                  wide_stereo=True)
         self.v.addWidget(self.fader, 1, QtCore.Qt.AlignRight)  # Also align right like ChannelStrip
 
 
@@ -2853,67 +3030,28 @@ class WideStereoStrip(QtWidgets.QFrame):
         else:
             self.scribble = None
 
-        # Apply custom styling to the scale widget in wide stereo strips only
-        if hasattr(self.fader, 'scale'):
-            # Override the paintEvent method for this specific scale widget
-            original_paint_event = self.fader.scale.paintEvent
-
-            def custom_paint_event(event):
-                # Call original paintEvent but with modified painter
-                painter = QtGui.QPainter(self.fader.scale)
-                rect = self.fader.scale.rect().adjusted(6, 6, -6, -6)
-                painter.setRenderHint(QtGui.QPainter.Antialiasing, True)
-
-                painter.setPen(QtGui.QPen(QtCore.Qt.gray, 1))
-                painter.drawLine(rect.right()-2, rect.top(), rect.right()-2, rect.bottom())
-
-                def y_for_cc(cc: int) -> int:
-                    t = cc / 127.0
-                    return int(rect.top() + (1.0 - t) * rect.height())
-
-                painter.setPen(QtGui.QPen(QtCore.Qt.black, 1))
-                font = painter.font()
-                font.setPointSizeF(max(7.0, BASE_SMALL_FONT * self.fader.scale.font_scale))
-                painter.setFont(font)
-
-                scale_points = MASTER_DB_POINTS if self.fader.scale.is_master else CHANNEL_DB_POINTS
-
-                for cc, label in scale_points:
-                    y = y_for_cc(cc) + 3  # Add 3px downward offset for wide stereo strip alignment
-                    painter.drawLine(rect.right()-6, y, rect.right()-2, y)
-                    text_rect = QtCore.QRect(rect.left(), y-8, rect.width()-8, 16)
-        
-                    # Remove "dB" text like we did before
-                    if "+" in label:
-                        short_label = label.replace(" dB", "").replace("+", "+")
-                    elif "-∞" in label or "-âˆž" in label:
-                        short_label = "-∞"
-                    else:
-                        short_label = label.replace(" dB", "")
-        
-                    painter.drawText(text_rect, QtCore.Qt.AlignRight | QtCore.Qt.AlignVCenter, short_label)
-
-            # Replace the paint event for this specific scale widget
-            self.fader.scale.paintEvent = custom_paint_event
-
         self.apply_scale(h_scale, v_scale)
     
     # Include all the same methods as ChannelStrip
+    @QtCore.pyqtSlot()
     def _pan_reset(self):
         self.pan.setValue(PAN_CENTER_CC)
 
+    @QtCore.pyqtSlot(int)
     def _on_pan_changed(self, val: int):
-        if val == PAN_CENTER_CC:
-            self.pan_value.setText("C")
-        elif val < PAN_CENTER_CC:
-            self.pan_value.setText(f"L{PAN_CENTER_CC - val}")
-        else:
-            self.pan_value.setText(f"R{val - PAN_CENTER_CC}")
+        if 0 <= val < len(PAN_LABELS):
+            self.pan_value.setText(PAN_LABELS[val])
         self.pan.update_color(val)
 
     def _on_scribble_changed(self):
-        # Update both left and right scribble keys with the same text
+        # Saving happens downstream, so hand it to the event loop and keep the edit itself responsive
         text = self.scribble.toPlainText() if self.scribble else ""
+        QtCore.QMetaObject.invokeMethod(self, "_emit_scribble", QtCore.Qt.QueuedConnection,
+                                        QtCore.Q_ARG(str, text))
+
+    @QtCore.pyqtSlot(str)
+    def _emit_scribble(self, text: str):
+        # Update both left and right scribble keys with the same text
         if self.left_scribble_key:
             self.scribbleTextChanged.emit(self.left_scribble_key, text)
         if self.right_scribble_key:
@@ -2939,11 +3077,15 @@ class WideStereoStrip(QtWidgets.QFrame):
         if self.mute:
             self.mute.setChecked(on)
 
+    def set_mute_from_cc(self, value: int):
+        self.set_mute_value(value >= 64)
+
     def set_scribble_text(self, text: str):
-        if self.scribble:
-            self.scribble.blockSignals(True)
+        # getText() drops the display line break, so it compares equal to the stored text
+        if self.scribble is None or self.scribble.getText() == text:
+            return
+        with QtCore.QSignalBlocker(self.scribble):
             self.scribble.setText(text)
-            self.scribble.blockSignals(False)
 
     def apply_scale(self, h_scale: float, v_scale: float):
         self.h_scale_factor = h_scale
@@ -2984,6 +3126,9 @@ class WideStereoStrip(QtWidgets.QFrame):
         self.fader.apply_scale(h_scale, v_scale)
         
 class MixerWindow(QtWidgets.QMainWindow):
+    # Queued to the MidiSendWorker thread
+    sendCCBatchRequested = QtCore.pyqtSignal(object)  # {(channel, cc): value}
+
     def __init__(self, csv_path: str):
         super().__init__()
         self.setWindowTitle("DM4800 Mixer Controller")
@@ -2991,20 +3136,42 @@ class MixerWindow(QtWidgets.QMainWindow):
 
         self.settings = SettingsManager()
         self.color_manager = ColorThemeManager(self.settings, self)
+        # Last color state pushed to the strips, so repeated signals with unchanged colors are ignored
+        self._last_fader_colors = None
+        self._last_pan_colors = None
+        self._last_master_strip_color = None
+        self._last_bg = None
         self._connect_color_manager_signals()
         
         # Apply initial styling using color manager
         self._apply_background_colors()
 
         self.mappings = load_midi_mappings(csv_path)
+        self._index_mappings()
         self.scribble_manager = ScribbleStripManager()
         self.mono_stereo_manager = MonoStereoManager()
         self.midi = MidiManager()
-        self.midi.midi_message_received.connect(self.on_midi_cc)
-        
+        # mido delivers input on its own backend thread and sends happen on the worker thread below,
+        # so both signals are always queued onto the GUI thread
+        self.midi.midi_message_received.connect(self.on_midi_cc, QtCore.Qt.QueuedConnection)
+
+        # UI-driven CC sends go through a worker thread so fader drags never block painting
+        self._midi_thread = QtCore.QThread(self)
+        self._midi_worker = MidiSendWorker(self.midi)
+        self._midi_worker.moveToThread(self._midi_thread)
+        self.sendCCBatchRequested.connect(self._midi_worker.send_batch)
+        # Last value sent to or received from the mixer per (channel, cc), for dropping repeats
+        self._last_cc_values: Dict[Tuple[int, int], int] = {}
+        # Sends made during one event loop pass are handed to the worker together
+        self._pending_cc: Dict[Tuple[int, int], int] = {}
+        self._cc_batch_timer = QtCore.QTimer(self)
+        self._cc_batch_timer.setSingleShot(True)
+        self._cc_batch_timer.setInterval(0)
+        self._cc_batch_timer.timeout.connect(self._flush_cc_batch)
+
         self.midi_monitor = MidiMonitorWindow()
-        self.midi.midi_message_received.connect(lambda ch, cc, val: self.midi_monitor.add_message("IN ", ch, cc, val))
-        self.midi.midi_message_sent.connect(lambda ch, cc, val: self.midi_monitor.add_message("OUT", ch, cc, val))
+        self.midi.midi_message_received.connect(self.midi_monitor.add_incoming, QtCore.Qt.QueuedConnection)
+        self.midi.midi_message_sent.connect(self.midi_monitor.add_outgoing, QtCore.Qt.QueuedConnection)
 
         self.h_scale_factor = 1.0  
         self.v_scale_factor = self.settings.get('vertical_zoom', 100) / 100.0
@@ -3028,58 +3195,108 @@ class MixerWindow(QtWidgets.QMainWindow):
         self.rows_v.setContentsMargins(1,1,1,1)
         self.rows_v.setSpacing(1)
         scroll.setWidget(container)
+        self.rows_container = container
 
-        self.channel_widgets: Dict[Tuple[str,int], ChannelStrip] = {}
+        self.channel_widgets: Dict[int, ChannelStrip] = {}
         self.bus_widgets: Dict[int, ChannelStrip] = {}
         self.aux_widgets: Dict[int, ChannelStrip] = {}
         self.master_widget: Optional[ChannelStrip] = None
-        self.stereo_pairs: Dict[str, ChannelStrip] = {}
+        # The dicts above are only ever cleared in place, so this stays valid across rebuilds
+        self._section_maps = {"channel": self.channel_widgets, "bus": self.bus_widgets, "aux": self.aux_widgets}
+        self._all_strips: List[ChannelStrip] = []  # Flat list of every strip above, rebuilt by _build_rows
+        self._wide_by_right: Dict[Tuple[str, int], WideStereoStrip] = {}  # Wide strips by (section, right number)
+        self._strip_pool: Dict[Tuple[str, int], ChannelStrip] = {}  # Mono strips carried across a rebuild
 
-        # State persistence for display mode switching
+        # State persistence for display mode switching, per section so empty sections cost nothing to restore
         self._saved_control_state = {
-            'faders': {},  # Key: (section, number) -> value
-            'pans': {},    # Key: (section, number) -> value  
-            'mutes': {}    # Key: (section, number) -> value
+            section: {
+                'faders': {},  # Key: number -> value
+                'pans': {},    # Key: number -> value
+                'mutes': {}    # Key: number -> value
+            }
+            for section in ('channel', 'bus', 'aux')
         }
         self._rebuilding_interface = False  # Guard flag to prevent recursive rebuilds
+        self._built_stereo_mode = None  # Stereo display mode the current strips were built for
+        # Mode toggles are coalesced so rapid on/off clicks cost at most one rebuild
+        self._rebuild_timer = QtCore.QTimer(self)
+        self._rebuild_timer.setSingleShot(True)
+        self._rebuild_timer.setInterval(0)
+        self._rebuild_timer.timeout.connect(self._rebuild_interface)
+        # Zoom slider drags are throttled to one rescale per frame
+        self._applied_v_scale = self.v_scale_factor  # Strips are built at this scale
+        self._zoom_timer = QtCore.QTimer(self)
+        self._zoom_timer.setSingleShot(True)
+        self._zoom_timer.setInterval(16)
+        self._zoom_timer.timeout.connect(self._apply_all_scales)
+        # Restyling the master strip is deferred until a run of zoom steps is over
+        self._master_bg_timer = QtCore.QTimer(self)
+        self._master_bg_timer.setSingleShot(True)
+        self._master_bg_timer.setInterval(50)
+        self._master_bg_timer.timeout.connect(self._apply_master_strip_background_color)
+        self._scribble_save_timer = QtCore.QTimer(self)
+        self._scribble_save_timer.setSingleShot(True)
+        self._scribble_save_timer.setInterval(250)
+        self._scribble_save_timer.timeout.connect(self.scribble_manager.save_scribble_data)
+        self._bg_menu: Optional[ContextColorMenu] = None  # Built on the first background right-click
 
         self._build_rows()
-        self._setup_stereo_pairs()
-        self._rewire_all_controls()
+        with self._bulk(self._strip_controls()):
+            self._setup_stereo_pairs()
+            self._wire_stereo_pairs()
+        self._index_rx_targets()
         self._load_scribble_strips()
         self._install_zoom_shortcuts()
 
         # Apply colors at startup
-        self._apply_background_colors()
-        self._refresh_all_fader_colors()
-        self._refresh_all_pan_colors()
-        self._apply_master_strip_background_color()
+        self._apply_all_visuals()
 
         if self.settings.get('remember_ports', True):
             self._auto_open_midi_ports()
 
+        # Started last so a failure anywhere above never leaves a running thread behind
+        self._midi_thread.start()
+
     def closeEvent(self, event):
         self.settings.save_settings()
+        if self._scribble_save_timer.isActive():
+            self._scribble_save_timer.stop()
+            self.scribble_manager.save_scribble_data()
+        # Send whatever the worker is still holding before the port closes
+        self._flush_cc_batch()
+        if self._midi_thread.isRunning():
+            # Queued behind any batches still pending, and never blocks on a hung port
+            QtCore.QMetaObject.invokeMethod(self._midi_worker, "flush_and_stop", QtCore.Qt.QueuedConnection)
+            if not self._midi_thread.wait(2000):
+                print("MIDI send thread did not stop within 2s")
         self.midi.close()
         self.midi_monitor.close()
         super().closeEvent(event)
 
+    # Window stylesheet with only the background color left to fill in
+    _BG_STYLE_TEMPLATE = (
+        "QMainWindow {{ background-color: {c}; color: black; }}"
+        " QWidget {{ background-color: {c}; color: black; }}"
+        " QScrollArea {{ background-color: {c}; color: black; }}"
+        " QLabel {{ color: black; }}"
+        " QPushButton {{ color: black; }}"
+        " QComboBox {{ color: black; }}"
+    )
+
     def _apply_background_colors(self):
         """Apply background colors from color manager"""
         bg_color = self.color_manager.get_background_color()
-        self.setStyleSheet(f"""
-            QMainWindow {{ background-color: {bg_color}; color: black; }}
-            QWidget {{ background-color: {bg_color}; color: black; }}
-            QScrollArea {{ background-color: {bg_color}; color: black; }}
-            QLabel {{ color: black; }}
-            QPushButton {{ color: black; }}
-            QComboBox {{ color: black; }}
-        """)
+        # The stylesheet cascades to widgets added later, so it only needs resetting when the color changes
+        if bg_color == self._last_bg:
+            return
+        self._last_bg = bg_color
+        self.setStyleSheet(self._BG_STYLE_TEMPLATE.format(c=bg_color))
     
     def _connect_color_manager_signals(self):
         """Connect color manager signals to update UI"""
         self.color_manager.backgroundColorChanged.connect(self._on_background_color_changed)
         self.color_manager.faderZeroDbColorChanged.connect(self._on_fader_color_changed)
+        self.color_manager.faderGradientEnabledChanged.connect(self._on_fader_color_changed)
         self.color_manager.panCenterColorChanged.connect(self._on_pan_color_changed)
         self.color_manager.panOffCenterColorChanged.connect(self._on_pan_color_changed)
         self.color_manager.panLeftColorChanged.connect(self._on_pan_color_changed)
@@ -3093,74 +3310,61 @@ class MixerWindow(QtWidgets.QMainWindow):
     
     def _on_fader_color_changed(self):
         """Handle fader color changes"""
-        self._refresh_all_fader_colors()
+        if self._fader_color_state() != self._last_fader_colors:
+            self._refresh_all_fader_colors()
     
     def _on_pan_color_changed(self):
         """Handle pan color changes"""
-        self._refresh_all_pan_colors()
+        if self._pan_color_state() != self._last_pan_colors:
+            self._refresh_all_pan_colors()
     
     def _on_master_strip_color_changed(self):
         """Handle master strip color changes"""
-        self._apply_master_strip_background_color()
+        if self.color_manager.get_master_strip_background_color() != self._last_master_strip_color:
+            self._apply_master_strip_background_color()
 
-    def _on_fader_color_changed(self):
-        """Handle fader color changes"""
-        self._refresh_all_fader_colors()
-    
-    def _on_pan_color_changed(self):
-        """Handle pan color changes"""
-        self._refresh_all_pan_colors()
+    def _fader_color_state(self) -> tuple:
+        """Color settings that affect how faders are drawn"""
+        return (self.color_manager.get_fader_zero_db_color(), self.color_manager.get_fader_gradient_enabled())
+
+    def _pan_color_state(self) -> tuple:
+        """Color settings that affect how pan dials are drawn"""
+        return (self.color_manager.get_pan_center_color(), self.color_manager.get_pan_off_center_color(),
+                self.color_manager.get_pan_left_color(), self.color_manager.get_pan_right_color(),
+                self.color_manager.get_pan_use_separate_lr_colors())
 
     def _refresh_all_fader_colors(self):
         """Refresh colors on all faders"""
-        # Refresh channel strip faders
-        for strip in self.channel_widgets.values():
-            if hasattr(strip, 'fader') and hasattr(strip.fader, 'slider'):
-                strip.fader.slider.refresh_colors()
-        
-        # Refresh bus strip faders
-        for strip in self.bus_widgets.values():
-            if hasattr(strip, 'fader') and hasattr(strip.fader, 'slider'):
-                strip.fader.slider.refresh_colors()
-        
-        # Refresh aux strip faders
-        for strip in self.aux_widgets.values():
-            if hasattr(strip, 'fader') and hasattr(strip.fader, 'slider'):
-                strip.fader.slider.refresh_colors()
-        
-        # Refresh master fader
-        if self.master_widget and hasattr(self.master_widget, 'fader') and hasattr(self.master_widget.fader, 'slider'):
-            self.master_widget.fader.slider.refresh_colors()
+        self._last_fader_colors = self._fader_color_state()
+        # Every strip builds its fader (and the fader its slider) on construction
+        for strip in self._all_strips:
+            strip.fader.slider.refresh_colors()
     
     def _refresh_all_pan_colors(self):
         """Refresh pan colors for all strips"""
-        # Refresh channel strips
-        for strip in self.channel_widgets.values():
-            if hasattr(strip, 'pan') and strip.pan:
-                strip.pan.refresh_colors()
-        
-        # Refresh bus strips
-        for strip in self.bus_widgets.values():
-            if hasattr(strip, 'pan') and strip.pan:
+        self._last_pan_colors = self._pan_color_state()
+        # pan is always set on strips, None when the strip has no pan control
+        for strip in self._all_strips:
+            if strip.pan:
                 strip.pan.refresh_colors()
-        
-        # Refresh aux strips
-        for strip in self.aux_widgets.values():
-            if hasattr(strip, 'pan') and strip.pan:
+
+    def _apply_all_visuals(self):
+        """Apply every color setting after strips are (re)built, in a single pass over the strips"""
+        self._apply_background_colors()
+        self._last_fader_colors = self._fader_color_state()
+        self._last_pan_colors = self._pan_color_state()
+        for strip in self._all_strips:
+            strip.fader.slider.refresh_colors()
+            if strip.pan:
                 strip.pan.refresh_colors()
-        
-        # Refresh wide stereo strips
-        for strip in self.stereo_pairs.values():
-            if hasattr(strip, 'left_pan') and strip.left_pan:
-                strip.left_pan.refresh_colors()
-            if hasattr(strip, 'right_pan') and strip.right_pan:
-                strip.right_pan.refresh_colors()
+        self._apply_master_strip_background_color()
 
     def _apply_master_strip_background_color(self):
         """Apply master strip background color"""
         if self.master_widget:
             master_bg_color = self.color_manager.get_master_strip_background_color()
             self.master_widget.setStyleSheet(f"ChannelStrip {{ background-color: {master_bg_color}; }}")
+            self._last_master_strip_color = master_bg_color
 
     def _create_menus(self):
         menubar = self.menuBar()
@@ -3292,240 +3496,99 @@ class MixerWindow(QtWidgets.QMainWindow):
         self.settings.save_settings()
     
         # Update checkbox to match
-        self.stereo_checkbox.blockSignals(True)
-        self.stereo_checkbox.setChecked(new_mode == 'wide_fader')
-        self.stereo_checkbox.blockSignals(False)
+        with QtCore.QSignalBlocker(self.stereo_checkbox):
+            self.stereo_checkbox.setChecked(new_mode == 'wide_fader')
         
         # Rebuild interface with new mode        
-        self._rebuild_interface()
+        self._rebuild_timer.start()
     
     def _capture_current_state(self):
         """Capture current fader, pan, and mute values before rebuilding interface"""
-        # Clear previous state
-        self._saved_control_state = {
-            'faders': {},
-            'pans': {},
-            'mutes': {}
-        }
-        
-        # Capture channel states
-        for (section, number), strip in self.channel_widgets.items():
-            if section == "channel":
-                # Store fader value
-                self._saved_control_state['faders'][('channel', number)] = strip.get_fader_value()
-                
-                # Store pan value if strip has pan control
-                if hasattr(strip, 'get_pan_value') and strip.get_pan_value is not None:
-                    self._saved_control_state['pans'][('channel', number)] = strip.get_pan_value()
-                
-                # Store mute value if strip has mute control
-                if hasattr(strip, 'get_mute_value'):
-                    self._saved_control_state['mutes'][('channel', number)] = strip.get_mute_value()
-        
-        # Capture bus states
-        for number, strip in self.bus_widgets.items():
-            # Store fader value
-            self._saved_control_state['faders'][('bus', number)] = strip.get_fader_value()
-            
-            # Store pan value if strip has pan control
-            if hasattr(strip, 'get_pan_value') and strip.get_pan_value is not None:
-                self._saved_control_state['pans'][('bus', number)] = strip.get_pan_value()
-            
-            # Store mute value if strip has mute control  
-            if hasattr(strip, 'get_mute_value'):
-                self._saved_control_state['mutes'][('bus', number)] = strip.get_mute_value()
-        
-        # Capture aux states
-        for number, strip in self.aux_widgets.items():
-            # Store fader value
-            self._saved_control_state['faders'][('aux', number)] = strip.get_fader_value()
-            
-            # Store pan value if strip has pan control
-            if hasattr(strip, 'get_pan_value') and strip.get_pan_value is not None:
-                self._saved_control_state['pans'][('aux', number)] = strip.get_pan_value()
-            
-            # Store mute value if strip has mute control
-            if hasattr(strip, 'get_mute_value'):
-                self._saved_control_state['mutes'][('aux', number)] = strip.get_mute_value()
-        
-        # Capture master state
+        # Every strip class provides get_pan_value()/get_mute_value(), returning
+        # PAN_CENTER_CC/False when the control is absent, so no probing is needed.
+        # Mono strips and the master are carried over by the strip pool, so only stereo strips are saved
+        strips = [(key, strip) for key, strip in self._keyed_strips() if strip.strip_kind != "mono"]
+        # A wide strip stands in for both halves of its pair
+        strips += [((key[0], strip.right_num), strip) for key, strip in strips if strip.strip_kind == "wide_stereo"]
+
+        # The same dicts are refilled on every rebuild rather than reallocated
+        for saved in self._saved_control_state.values():
+            for values in saved.values():
+                values.clear()
+        for (section, number), strip in strips:
+            saved = self._saved_control_state[section]
+            saved['faders'][number] = strip.get_fader_value()
+            saved['pans'][number] = strip.get_pan_value()
+            saved['mutes'][number] = strip.get_mute_value()
+
+    def _keyed_strips(self) -> List[Tuple[Tuple[str, int], object]]:
+        """All strips paired with their (section, number) saved-state key"""
+        strips = [((section, number), strip)
+                  for section, widgets in self._section_maps.items() for number, strip in widgets.items()]
         if self.master_widget:
-            self._saved_control_state['faders'][('master', 1)] = self.master_widget.get_fader_value()
-            
-            # Master typically doesn't have pan or mute, but check just in case
-            if hasattr(self.master_widget, 'get_pan_value') and self.master_widget.get_pan_value is not None:
-                self._saved_control_state['pans'][('master', 1)] = self.master_widget.get_pan_value()
-            
-            if hasattr(self.master_widget, 'get_mute_value'):
-                self._saved_control_state['mutes'][('master', 1)] = self.master_widget.get_mute_value()
-        
-        #print(f"Captured state: {len(self._saved_control_state['faders'])} faders, {len(self._saved_control_state['pans'])} pans, {len(self._saved_control_state['mutes'])} mutes")
+            strips.append((('master', 1), self.master_widget))
+        return strips
 
     def _restore_saved_state(self):
         """Restore previously captured fader, pan, and mute values after rebuilding interface"""
-        if not self._saved_control_state:
-            return
-        
         restored_count = {'faders': 0, 'pans': 0, 'mutes': 0}
-        
-        # Restore channel states
-        for (section, number), strip in self.channel_widgets.items():
-            if section == "channel":
+
+        for section, saved in self._saved_control_state.items():
+            # Every strip defines fader/pan/pan_value/mute (None when absent), so no hasattr probing is needed
+            saved_faders = saved['faders']
+            saved_pans = saved['pans']
+            saved_mutes = saved['mutes']
+            if not (saved_faders or saved_pans or saved_mutes):
+                continue  # Nothing was stereo in this section
+
+            for number, strip in self._section_maps[section].items():
+                if strip.strip_kind == "mono":
+                    continue  # Reused from the pool with its values intact
                 # Restore fader value - set directly on slider widget
-                fader_key = ('channel', number)
-                if fader_key in self._saved_control_state['faders']:
-                    if hasattr(strip, 'fader') and strip.fader:
-                        value = self._saved_control_state['faders'][fader_key]
-                        strip.fader.setValue(value)  # Direct widget call
-                        restored_count['faders'] += 1
-                
-                # Restore pan value - set directly on pan widget
-                pan_key = ('channel', number)
-                if pan_key in self._saved_control_state['pans']:
-                    if hasattr(strip, 'pan') and strip.pan:
-                        value = self._saved_control_state['pans'][pan_key]
-                        strip.pan.setValue(value)  # Direct widget call
-                        # Update the display text manually
-                        if hasattr(strip, 'pan_value') and strip.pan_value:
-                            if value == 64:  # PAN_CENTER_CC
-                                strip.pan_value.setText("C")
-                            elif value < 64:
-                                strip.pan_value.setText(f"L{64 - value}")
-                            else:
-                                strip.pan_value.setText(f"R{value - 64}")
-                        # Update pan color manually
-                        if hasattr(strip.pan, 'update_color'):
-                            strip.pan.update_color(value)
-                        restored_count['pans'] += 1
-                
-                # Restore mute value - set directly on mute widget
-                mute_key = ('channel', number)
-                if mute_key in self._saved_control_state['mutes']:
-                    if hasattr(strip, 'mute') and strip.mute:
-                        value = self._saved_control_state['mutes'][mute_key]
-                        strip.mute.setChecked(value)  # Direct widget call
-                        # Update mute button style manually
-                        if hasattr(strip.mute, 'update_style'):
-                            strip.mute.update_style()
-                        restored_count['mutes'] += 1
-        
-        # Restore bus states
-        for number, strip in self.bus_widgets.items():
-            # Restore fader value
-            fader_key = ('bus', number)
-            if fader_key in self._saved_control_state['faders']:
-                if hasattr(strip, 'fader') and strip.fader:
-                    value = self._saved_control_state['faders'][fader_key]
+                value = saved_faders.get(number, _MISSING)
+                if value is not _MISSING and strip.fader:
                     strip.fader.setValue(value)
                     restored_count['faders'] += 1
-            
-            # Restore pan value
-            pan_key = ('bus', number)
-            if pan_key in self._saved_control_state['pans']:
-                if hasattr(strip, 'pan') and strip.pan:
-                    value = self._saved_control_state['pans'][pan_key]
-                    strip.pan.setValue(value)
-                    # Update display and color
-                    if hasattr(strip, 'pan_value') and strip.pan_value:
-                        if value == 64:
-                            strip.pan_value.setText("C")
-                        elif value < 64:
-                            strip.pan_value.setText(f"L{64 - value}")
-                        else:
-                            strip.pan_value.setText(f"R{value - 64}")
-                    if hasattr(strip.pan, 'update_color'):
-                        strip.pan.update_color(value)
-                    restored_count['pans'] += 1
-            
-            # Restore mute value
-            mute_key = ('bus', number)
-            if mute_key in self._saved_control_state['mutes']:
-                if hasattr(strip, 'mute') and strip.mute:
-                    value = self._saved_control_state['mutes'][mute_key]
-                    strip.mute.setChecked(value)
-                    if hasattr(strip.mute, 'update_style'):
-                        strip.mute.update_style()
-                    restored_count['mutes'] += 1
-        
-        # Restore aux states
-        for number, strip in self.aux_widgets.items():
-            # Restore fader value
-            fader_key = ('aux', number)
-            if fader_key in self._saved_control_state['faders']:
-                if hasattr(strip, 'fader') and strip.fader:
-                    value = self._saved_control_state['faders'][fader_key]
-                    strip.fader.setValue(value)
-                    restored_count['faders'] += 1
-            
-            # Restore pan value
-            pan_key = ('aux', number)
-            if pan_key in self._saved_control_state['pans']:
-                if hasattr(strip, 'pan') and strip.pan:
-                    value = self._saved_control_state['pans'][pan_key]
-                    strip.pan.setValue(value)
-                    # Update display and color
-                    if hasattr(strip, 'pan_value') and strip.pan_value:
-                        if value == 64:
-                            strip.pan_value.setText("C")
-                        elif value < 64:
-                            strip.pan_value.setText(f"L{64 - value}")
-                        else:
-                            strip.pan_value.setText(f"R{value - 64}")
-                    if hasattr(strip.pan, 'update_color'):
-                        strip.pan.update_color(value)
-                    restored_count['pans'] += 1
-            
-            # Restore mute value
-            mute_key = ('aux', number)
-            if mute_key in self._saved_control_state['mutes']:
-                if hasattr(strip, 'mute') and strip.mute:
-                    value = self._saved_control_state['mutes'][mute_key]
-                    strip.mute.setChecked(value)
-                    if hasattr(strip.mute, 'update_style'):
-                        strip.mute.update_style()
-                    restored_count['mutes'] += 1
-        
-        # Restore master state
-        if self.master_widget:
-            fader_key = ('master', 1)
-            if fader_key in self._saved_control_state['faders']:
-                if hasattr(self.master_widget, 'fader') and self.master_widget.fader:
-                    value = self._saved_control_state['faders'][fader_key]
-                    self.master_widget.fader.setValue(value)
-                    restored_count['faders'] += 1
-            
-            # Master usually doesn't have pan or mute, but handle if it does
-            pan_key = ('master', 1)
-            if pan_key in self._saved_control_state['pans']:
-                if hasattr(self.master_widget, 'pan') and self.master_widget.pan:
-                    value = self._saved_control_state['pans'][pan_key]
-                    self.master_widget.pan.setValue(value)
+                
+                # Restore pan value, including its label and color
+                value = saved_pans.get(number, _MISSING)
+                if value is not _MISSING and strip.pan:
+                    self._restore_pan(strip, value)
                     restored_count['pans'] += 1
-            
-            mute_key = ('master', 1)
-            if mute_key in self._saved_control_state['mutes']:
-                if hasattr(self.master_widget, 'mute') and self.master_widget.mute:
-                    value = self._saved_control_state['mutes'][mute_key]
-                    self.master_widget.mute.setChecked(value)
-                    if hasattr(self.master_widget.mute, 'update_style'):
-                        self.master_widget.mute.update_style()
+                
+                # Restore mute value and update the button style manually.
+                # Signals stay blocked so the restore sends no MIDI back to the mixer
+                value = saved_mutes.get(number, _MISSING)
+                if value is not _MISSING and strip.mute:
+                    with QtCore.QSignalBlocker(strip.mute):
+                        strip.mute.setChecked(value)
+                    strip.mute.update_style()
                     restored_count['mutes'] += 1
         
         #print(f"Restored state: {restored_count['faders']} faders, {restored_count['pans']} pans, {restored_count['mutes']} mutes")
 
+    @staticmethod
+    def _restore_pan(strip, value: int):
+        """Set a restored pan value and bring the strip's pan label and color in line with it"""
+        # Blocked so the restore neither sends MIDI nor syncs the stereo partner (which restores its own value)
+        with QtCore.QSignalBlocker(strip.pan):
+            strip.pan.setValue(value)
+        strip._on_pan_changed(value)
+
     def _on_stereo_checkbox_changed(self, checked: bool):
         """Handle stereo display checkbox change"""
         new_mode = 'wide_fader' if checked else 'linked_pair'
+        if new_mode == self.settings.get('stereo_display_mode', 'linked_pair'):
+            return
         self.settings.set('stereo_display_mode', new_mode)
         self.settings.save_settings()
     
         # Update menu action to match
-        self.stereo_display_action.blockSignals(True)
-        self.stereo_display_action.setChecked(checked)
-        self.stereo_display_action.blockSignals(False)
+        with QtCore.QSignalBlocker(self.stereo_display_action):
+            self.stereo_display_action.setChecked(checked)
     
         # Rebuild interface with new mode
-        self._rebuild_interface()
+        self._rebuild_timer.start()
     
     def _rebuild_interface(self):
         """Rebuild the entire interface when stereo display mode changes"""
@@ -3533,13 +3596,22 @@ class MixerWindow(QtWidgets.QMainWindow):
         if self._rebuilding_interface:
             #print("DEBUG: Preventing recursive rebuild")
             return
+
+        # Toggled back before the queued rebuild ran - the strips already match
+        if self.settings.get('stereo_display_mode', 'linked_pair') == self._built_stereo_mode:
+            return
             
         #print("DEBUG: Starting rebuild")
         self._rebuilding_interface = True
+        # Hold off repaints until every row is back, instead of relaying out per added strip
+        self.setUpdatesEnabled(False)
         
         try:
             # STEP 1: Capture current state before destroying widgets
             self._capture_current_state()
+
+            # Keep mono strips out of the teardown - they are identical in both modes
+            self._pool_mono_strips()
             
             # Clear existing widgets
             for i in reversed(range(self.rows_v.count())):
@@ -3552,18 +3624,18 @@ class MixerWindow(QtWidgets.QMainWindow):
             self.bus_widgets.clear()
             self.aux_widgets.clear()
             self.master_widget = None
+            self._all_strips = []
         
             # Rebuild
             self._build_rows()
-            self._setup_stereo_pairs()
-            self._rewire_all_controls()
+            with self._bulk(self._strip_controls()):
+                self._setup_stereo_pairs()
+                self._wire_stereo_pairs()
+            self._index_rx_targets()
             self._load_scribble_strips()
             
             # CRITICAL: Reapply colors after rebuilding interface
-            self._apply_background_colors()
-            self._refresh_all_fader_colors()
-            self._refresh_all_pan_colors()
-            self._apply_master_strip_background_color()
+            self._apply_all_visuals()
             
             # STEP 2: Restore saved state after rebuilding widgets
             self._restore_saved_state()
@@ -3571,6 +3643,7 @@ class MixerWindow(QtWidgets.QMainWindow):
         finally:
             # Always reset the rebuild flag, even if an error occurred
             self._rebuilding_interface = False
+            self.setUpdatesEnabled(True)
             #print("DEBUG: Rebuild complete")
     
     def _build_zoom_row(self):
@@ -3600,502 +3673,329 @@ class MixerWindow(QtWidgets.QMainWindow):
         zoom_reset = QtWidgets.QShortcut(QtGui.QKeySequence("Ctrl+0"), self)
         zoom_reset_mac = QtWidgets.QShortcut(QtGui.QKeySequence("Meta+0"), self)
 
-        zoom_in.activated.connect(lambda: self.v_zoom_slider.setValue(min(125, self.v_zoom_slider.value()+10)))
-        zoom_out.activated.connect(lambda: self.v_zoom_slider.setValue(max(50, self.v_zoom_slider.value()-10)))
-        zoom_reset.activated.connect(lambda: self.v_zoom_slider.setValue(100))
-        zoom_reset_mac.activated.connect(lambda: self.v_zoom_slider.setValue(100))
+        zoom_in.activated.connect(self._zoom_in)
+        zoom_out.activated.connect(self._zoom_out)
+        zoom_reset.activated.connect(self._zoom_reset)
+        zoom_reset_mac.activated.connect(self._zoom_reset)
+
+    @QtCore.pyqtSlot()
+    def _zoom_in(self):
+        self.v_zoom_slider.setValue(min(125, self.v_zoom_slider.value()+10))
+
+    @QtCore.pyqtSlot()
+    def _zoom_out(self):
+        self.v_zoom_slider.setValue(max(50, self.v_zoom_slider.value()-10))
+
+    @QtCore.pyqtSlot()
+    def _zoom_reset(self):
+        self.v_zoom_slider.setValue(100)
 
     def _build_rows(self):
-        use_wide_stereo = self.settings.get('stereo_display_mode') == 'wide_fader'
-        
-        def add_channel_row(start, end, include_pan=True, include_master=False):
+        self._built_stereo_mode = self.settings.get('stereo_display_mode', 'linked_pair')
+        use_wide_stereo = self._built_stereo_mode == 'wide_fader'
+        # Bind the lookups used for every strip once instead of on each loop pass
+        msm = self.mono_stereo_manager
+        h_scale = self.h_scale_factor
+        v_scale = self.v_scale_factor
+        wire = self._wire_strip_controls
+        on_scribble = self._on_scribble_text_changed
+        take_pooled = self._take_pooled_strip
+        wide_by_right = self._wide_by_right
+        wide_by_right.clear()
+
+        def new_row():
             row = QtWidgets.QWidget()
             h = QtWidgets.QHBoxLayout(row)
             h.setContentsMargins(0,0,0,0)
             h.setSpacing(1)
             h.setAlignment(QtCore.Qt.AlignLeft)
-    
-            strips_added = 0
-            ch = start
-            
-            while ch <= end and strips_added < 24:
-                scribble_key = f"Channel {ch}"
-    
-                if self.mono_stereo_manager.is_stereo_pair(scribble_key):
-                    if self.mono_stereo_manager.is_stereo_left(scribble_key):
-                        partner_key = self.mono_stereo_manager.get_stereo_partner(scribble_key)
-                        partner_num = int(partner_key.split()[1]) if partner_key else 0
-
-                        if use_wide_stereo:
-                            # Create wide stereo strip
-                            strip = WideStereoStrip(
-                                f"Ch {ch}-{partner_num}", 
-                                left_scribble_key=scribble_key,
-                                right_scribble_key=partner_key,
-                                section_type="channel",
-                                left_num=ch, 
-                                right_num=partner_num,
-                                has_pan=include_pan, 
-                                has_mute=True, 
-                                has_scribble=True,
-                                h_scale=self.h_scale_factor, 
-                                v_scale=self.v_scale_factor,
-                                mono_stereo_manager=self.mono_stereo_manager
-                            )
-                            h.addWidget(strip)
-                            self.channel_widgets[("channel", ch)] = strip
-                            self._wire_strip_controls("channel", ch, strip)
-                            strip.scribbleTextChanged.connect(self._on_scribble_text_changed)
-                        else:
-                            # Create left channel strip
-                            left_strip = ChannelStrip(f"Ch {ch}", scribble_key=scribble_key, has_pan=include_pan, 
-                                                   has_mute=True, has_scribble=True,
-                                                   h_scale=self.h_scale_factor, v_scale=self.v_scale_factor, 
-                                                   is_master=False, mono_stereo_manager=self.mono_stereo_manager,
-                                                   is_stereo_pair=True, stereo_partner_num=partner_num)
-                            h.addWidget(left_strip)
-                            self.channel_widgets[("channel", ch)] = left_strip
-                            self._wire_strip_controls("channel", ch, left_strip)
-                            left_strip.scribbleTextChanged.connect(self._on_scribble_text_changed)
-
-                            # Create right channel strip
-                            right_strip = ChannelStrip(f"Ch {partner_num}", scribble_key=partner_key, has_pan=include_pan, 
-                                                    has_mute=True, has_scribble=True,
-                                                    h_scale=self.h_scale_factor, v_scale=self.v_scale_factor, 
-                                                    is_master=False, mono_stereo_manager=self.mono_stereo_manager,
-                                                    is_stereo_pair=True, stereo_partner_num=ch)
-                            h.addWidget(right_strip)
-                            self.channel_widgets[("channel", partner_num)] = right_strip
-                            self._wire_strip_controls("channel", partner_num, right_strip)
-                            right_strip.scribbleTextChanged.connect(self._on_scribble_text_changed)
-                        
-                        strips_added += 2
-                        ch += 2
-                    else:
-                        ch += 1
-                else:
-                    strip = ChannelStrip(f"Ch {ch}", scribble_key=scribble_key, has_pan=include_pan, 
-                                       has_mute=True, has_scribble=True,
-                                       h_scale=self.h_scale_factor, v_scale=self.v_scale_factor, 
-                                       is_master=False, mono_stereo_manager=self.mono_stereo_manager)
-                    h.addWidget(strip)
-                    self.channel_widgets[("channel", ch)] = strip
-                    self._wire_strip_controls("channel", ch, strip)
-                    strip.scribbleTextChanged.connect(self._on_scribble_text_changed)
-                    strips_added += 1
-                    ch += 1
-            
-            if include_master:
-                h.addSpacing(1)
-                ms = ChannelStrip("Main", has_pan=False, has_mute=False, has_scribble=False,
-                                h_scale=self.h_scale_factor, v_scale=self.v_scale_factor, is_master=True)
-                h.addWidget(ms)
-                self.master_widget = ms
-                self._wire_strip_controls("master", 1, ms)
-            
-            self.rows_v.addWidget(row)
-            h.addStretch()  # Push all strips to the left
-            return ch
+            return row, h
 
-        next_ch = add_channel_row(1, 64, include_pan=True, include_master=True)
-        
-        if next_ch <= 64:
-            next_ch = add_channel_row(next_ch, 64, include_pan=True, include_master=False)
-        
-        if next_ch <= 64:
-            add_channel_row(next_ch, 64, include_pan=True, include_master=False)
+        def finish_row(row, h):
+            h.addStretch()  # Push all strips to the left
+            self.rows_v.addWidget(row)
 
+        def add_entry(h, section, title, widgets, include_pan, kind, num, partner_num):
+            scribble_key = f"{section.title()} {num}"
 
+            if kind == "mono":
+                strip = take_pooled((section, num), h)
+                if strip is None:
+                    strip = ChannelStrip(f"{title} {num}", scribble_key=scribble_key, has_pan=include_pan, 
+                                       has_mute=True, has_scribble=True,
+                                       h_scale=h_scale, v_scale=v_scale, 
+                                       is_master=False, mono_stereo_manager=msm)
+                    h.addWidget(strip)
+                    strip.scribbleTextChanged.connect(on_scribble)
+                    # Pooled strips keep the connections made here - mono wiring never changes
+                    wire(section, num, strip)
+                widgets[num] = strip
+                return
 
-        bus_row = QtWidgets.QWidget()
-        hbus = QtWidgets.QHBoxLayout(bus_row)
-        hbus.setContentsMargins(0,0,0,0)
-        hbus.setSpacing(1)
-        hbus.setAlignment(QtCore.Qt.AlignLeft)
-        
-        strips_added = 0
-        b = 1
-        
-        while b <= 24 and strips_added < 24:
-            scribble_key = f"Bus {b}"
-            
-            if self.mono_stereo_manager.is_stereo_pair(scribble_key):
-                if self.mono_stereo_manager.is_stereo_left(scribble_key):
-                    partner_key = self.mono_stereo_manager.get_stereo_partner(scribble_key)
-                    partner_num = int(partner_key.split()[1]) if partner_key else 0
-        
-                    if use_wide_stereo:
-                        # Create wide stereo bus strip
-                        strip = WideStereoStrip(
-                            f"Bus {b}-{partner_num}", 
-                            left_scribble_key=scribble_key,
-                            right_scribble_key=partner_key,
-                            section_type="bus",
-                            left_num=b, 
-                            right_num=partner_num,
-                            has_pan=False, 
-                            has_mute=True, 
-                            has_scribble=True,
-                            h_scale=self.h_scale_factor, 
-                            v_scale=self.v_scale_factor,
-                            mono_stereo_manager=self.mono_stereo_manager
-                        )
-                        hbus.addWidget(strip)
-                        self.bus_widgets[b] = strip
-                        self._wire_strip_controls("bus", b, strip)
-                        strip.scribbleTextChanged.connect(self._on_scribble_text_changed)
-            
-                        strips_added += 2
-                        b += 2
-                    else:
-                        # Create both left and right bus strips for linked pair mode
-                        left_strip = ChannelStrip(f"Bus {b}", scribble_key=scribble_key, has_pan=False, has_mute=True, has_scribble=True,
-                                               h_scale=self.h_scale_factor, v_scale=self.v_scale_factor, is_master=False, 
-                                               mono_stereo_manager=self.mono_stereo_manager, is_stereo_pair=True, stereo_partner_num=partner_num)
-                        hbus.addWidget(left_strip)
-                        self.bus_widgets[b] = left_strip
-                        self._wire_strip_controls("bus", b, left_strip)
-                        left_strip.scribbleTextChanged.connect(self._on_scribble_text_changed)
-            
-                        right_strip = ChannelStrip(f"Bus {partner_num}", scribble_key=partner_key, has_pan=False, has_mute=True, has_scribble=True,
-                                                 h_scale=self.h_scale_factor, v_scale=self.v_scale_factor, is_master=False,
-                                                 mono_stereo_manager=self.mono_stereo_manager, is_stereo_pair=True, stereo_partner_num=b)
-                        hbus.addWidget(right_strip)
-                        self.bus_widgets[partner_num] = right_strip
-                        self._wire_strip_controls("bus", partner_num, right_strip)
-                        right_strip.scribbleTextChanged.connect(self._on_scribble_text_changed)
-            
-                        strips_added += 2
-                        b += 2
-                else:
-                    b += 1
-                    
-            else:
-                strip = ChannelStrip(f"Bus {b}", scribble_key=scribble_key, has_pan=False, has_mute=True, has_scribble=True,
-                                   h_scale=self.h_scale_factor, v_scale=self.v_scale_factor, is_master=False, mono_stereo_manager=self.mono_stereo_manager)
-                hbus.addWidget(strip)
-                self.bus_widgets[b] = strip
-                self._wire_strip_controls("bus", b, strip)
-                strip.scribbleTextChanged.connect(self._on_scribble_text_changed)
-            
-                strips_added += 1
-                b += 1
-        
-        hbus.addStretch()  # Push all bus strips to the left
-        self.rows_v.addWidget(bus_row)
-
-        aux_row = QtWidgets.QWidget()
-        haux = QtWidgets.QHBoxLayout(aux_row)
-        haux.setContentsMargins(0,0,0,0)
-        haux.setSpacing(1)
-        haux.setAlignment(QtCore.Qt.AlignLeft)
-       
-        strips_added = 0
-        a = 1
-        
-        while a <= 12 and strips_added < 12:
-            scribble_key = f"Aux {a}"
-        
-            if self.mono_stereo_manager.is_stereo_pair(scribble_key):
-                if self.mono_stereo_manager.is_stereo_left(scribble_key):
-                   partner_key = self.mono_stereo_manager.get_stereo_partner(scribble_key)
-                   partner_num = int(partner_key.split()[1]) if partner_key else 0
-
-                   if use_wide_stereo:
-                       # Create wide stereo aux strip
-                       strip = WideStereoStrip(
-                           f"Aux {a}-{partner_num}", 
-                           left_scribble_key=scribble_key,
-                           right_scribble_key=partner_key,
-                           section_type="aux",
-                           left_num=a, 
-                           right_num=partner_num,
-                           has_pan=False, 
-                           has_mute=True, 
-                           has_scribble=True,
-                           h_scale=self.h_scale_factor, 
-                           v_scale=self.v_scale_factor,
-                           mono_stereo_manager=self.mono_stereo_manager
-                       )
-                       haux.addWidget(strip)
-                       self.aux_widgets[a] = strip
-                       self._wire_strip_controls("aux", a, strip)
-                       strip.scribbleTextChanged.connect(self._on_scribble_text_changed)
-           
-                       strips_added += 2
-                       a += 2
-                   else:
-                       # Create both left and right aux strips for linked pair mode
-                       left_strip = ChannelStrip(f"Aux {a}", scribble_key=scribble_key, has_pan=False, has_mute=True, has_scribble=True,
-                                               h_scale=self.h_scale_factor, v_scale=self.v_scale_factor, is_master=False, 
-                                               mono_stereo_manager=self.mono_stereo_manager, is_stereo_pair=True, stereo_partner_num=partner_num)
-                       haux.addWidget(left_strip)
-                       self.aux_widgets[a] = left_strip
-                       self._wire_strip_controls("aux", a, left_strip)
-                       left_strip.scribbleTextChanged.connect(self._on_scribble_text_changed)
-           
-                       right_strip = ChannelStrip(f"Aux {partner_num}", scribble_key=partner_key, has_pan=False, has_mute=True, has_scribble=True,
-                                                h_scale=self.h_scale_factor, v_scale=self.v_scale_factor, is_master=False,
-                                                mono_stereo_manager=self.mono_stereo_manager, is_stereo_pair=True, stereo_partner_num=a)
-                       haux.addWidget(right_strip)
-                       self.aux_widgets[partner_num] = right_strip
-                       self._wire_strip_controls("aux", partner_num, right_strip)
-                       right_strip.scribbleTextChanged.connect(self._on_scribble_text_changed)
-           
-                       strips_added += 2
-                       a += 2
-                else:
-                   a += 1
-                   
+            partner_key = f"{section.title()} {partner_num}"
+            if use_wide_stereo:
+                # Create wide stereo strip
+                strip = WideStereoStrip(
+                    f"{title} {num}-{partner_num}", 
+                    left_scribble_key=scribble_key,
+                    right_scribble_key=partner_key,
+                    section_type=section,
+                    left_num=num, 
+                    right_num=partner_num,
+                    has_pan=include_pan, 
+                    has_mute=True, 
+                    has_scribble=True,
+                    h_scale=h_scale, 
+                    v_scale=v_scale,
+                    mono_stereo_manager=msm
+                )
+                h.addWidget(strip)
+                widgets[num] = strip
+                wide_by_right[(section, partner_num)] = strip
+                wire(section, num, strip)
+                strip.scribbleTextChanged.connect(on_scribble)
             else:
-               strip = ChannelStrip(f"Aux {a}", scribble_key=scribble_key, has_pan=False, has_mute=True, has_scribble=True,
-                                  h_scale=self.h_scale_factor, v_scale=self.v_scale_factor, is_master=False, mono_stereo_manager=self.mono_stereo_manager)
-               haux.addWidget(strip)
-               self.aux_widgets[a] = strip
-               self._wire_strip_controls("aux", a, strip)
-               strip.scribbleTextChanged.connect(self._on_scribble_text_changed)
-           
-               strips_added += 1
-               a += 1
-        
-        haux.addStretch()  # Push all aux strips to the left
-        self.rows_v.addWidget(aux_row)
+                # Create left then right strip of the linked pair; they are wired once paired up
+                for n, key, other in ((num, scribble_key, partner_num), (partner_num, partner_key, num)):
+                    strip = ChannelStrip(f"{title} {n}", scribble_key=key, has_pan=include_pan, 
+                                       has_mute=True, has_scribble=True,
+                                       h_scale=h_scale, v_scale=v_scale, 
+                                       is_master=False, mono_stereo_manager=msm,
+                                       is_stereo_pair=True, stereo_partner_num=other)
+                    h.addWidget(strip)
+                    widgets[n] = strip
+                    strip.scribbleTextChanged.connect(on_scribble)
+
+        # Channels wrap onto a new row once 24 strips are placed; the master ends the first row
+        channel_rows = []
+        strips_added = 24
+        for entry in msm.layout_for_section("Channel", 64):
+            if strips_added >= 24:
+                channel_rows.append([])
+                strips_added = 0
+            channel_rows[-1].append(entry)
+            strips_added += 1 if entry[0] == "mono" else 2
+
+        for row_index, entries in enumerate(channel_rows):
+            row, h = new_row()
+            for entry in entries:
+                add_entry(h, "channel", "Ch", self.channel_widgets, True, *entry)
+
+            if row_index == 0:
+                h.addSpacing(1)
+                ms = take_pooled(("master", 1), h)
+                if ms is None:
+                    ms = ChannelStrip("Main", has_pan=False, has_mute=False, has_scribble=False,
+                                    h_scale=h_scale, v_scale=v_scale, is_master=True)
+                    h.addWidget(ms)
+                    wire("master", 1, ms)
+                self.master_widget = ms
+            finish_row(row, h)
+
+        # Buses and aux sends each fit on a single row
+        for section, title, widgets, count in (("bus", "Bus", self.bus_widgets, 24), ("aux", "Aux", self.aux_widgets, 12)):
+            row, h = new_row()
+            for entry in msm.layout_for_section(section.title(), count):
+                add_entry(h, section, title, widgets, False, *entry)
+            finish_row(row, h)
+
+        self._all_strips = (list(self.channel_widgets.values()) + list(self.bus_widgets.values()) +
+                            list(self.aux_widgets.values()) + ([self.master_widget] if self.master_widget else []))
+
+        # Anything left in the pool has no place in the new layout
+        for strip in self._strip_pool.values():
+            strip.deleteLater()
+        self._strip_pool.clear()
+
+    def _take_pooled_strip(self, key: Tuple[str, int], layout: QtWidgets.QBoxLayout) -> Optional[ChannelStrip]:
+        """Reattach a mono strip kept from the previous build to layout, or return None if there is none"""
+        strip = self._strip_pool.pop(key, None)
+        if strip is not None:
+            layout.addWidget(strip)
+            strip.show()  # Detaching hid it
+        return strip
+
+    def _pool_mono_strips(self):
+        """Detach mono strips (and master) from their rows so the rebuild can reuse them instead of recreating them.
+        
+        Only stereo pairs look different between linked-pair and wide-fader mode."""
+        for key, strip in self._keyed_strips():
+            if strip.strip_kind == "mono":
+                strip.setParent(None)
+                self._strip_pool[key] = strip
 
     def _wire_strip_controls(self, section: str, number: int, strip: ChannelStrip):
-        def map_for(t: str) -> Optional[MidiMapping]:
-            return self.mappings.get((section, number, t))
-
-        key = f"{section.title()} {number}"
-        is_stereo = hasattr(strip, 'is_stereo_pair') and strip.is_stereo_pair
-        has_partner = hasattr(strip, 'stereo_partner_strip') and strip.stereo_partner_strip
-        mode_check = self.settings.get('stereo_display_mode', 'linked_pair') == 'linked_pair'
-        is_wide_stereo = isinstance(strip, WideStereoStrip)
-        
-        # Disconnect any existing connections to avoid double-wiring
-        try:
-            strip.fader.valueChanged.disconnect()
-        except:
-            pass
-        if strip.mute:
-            try:
-                strip.mute.toggledCC.disconnect()
-                strip.mute.toggled.disconnect()
-            except:
-                pass
-        if strip.pan:
-            try:
-                strip.pan.valueChanged.disconnect()
-                strip.pan.doubleClicked.disconnect()
-            except:
-                pass
-                
-        # Handle WideStereoStrip differently
-        if isinstance(strip, WideStereoStrip):
-            # Wire MIDI for wide stereo strips using left channel mappings
-            left_fader_mapping = self.mappings.get((section, strip.left_num, 'fader'))
-            if left_fader_mapping:
-                strip.fader.valueChanged.connect(lambda v, m=left_fader_mapping: self.midi.send_cc(m.midi_channel, m.cc_number, v))
-        
-            if strip.mute:
-                # Reconnect essential mute functions
-                strip.mute.toggled.connect(strip.mute._on_toggled)
-            
-                left_mute_mapping = self.mappings.get((section, strip.left_num, 'mute'))
-                if left_mute_mapping:
-                    strip.mute.toggledCC.connect(lambda v, m=left_mute_mapping: self.midi.send_cc(m.midi_channel, m.cc_number, v))
-        
-            if strip.pan:
-                # Reconnect essential pan functions
-                strip.pan.doubleClicked.connect(strip._pan_reset)
-                strip.pan.valueChanged.connect(strip._on_pan_changed)
-            
-                left_pan_mapping = self.mappings.get((section, strip.left_num, 'pan'))
-                if left_pan_mapping:
-                    strip.pan.valueChanged.connect(lambda v, m=left_pan_mapping: self.midi.send_cc(m.midi_channel, m.cc_number, v))
-            return
-
-
-        # Handle MIDI output for stereo pairs vs regular strips
-        if (hasattr(strip, 'is_stereo_pair') and strip.is_stereo_pair and hasattr(strip, 'stereo_partner_strip') and strip.stereo_partner_strip and
-            self.settings.get('stereo_display_mode', 'linked_pair') == 'linked_pair' and
-            not isinstance(strip, WideStereoStrip)):
-        
-            # For stereo pairs, both channels send the LEFT channel's MIDI commands
+        """Connect a strip's controls to MIDI. Called once per strip: pooled mono strips keep
+        their connections and stereo strips are created fresh on every build"""
+        # Received CC values go straight to these, keyed by mapping type
+        strip._midi_setters = {"fader": strip.set_fader_value, "mute": strip.set_mute_from_cc, "pan": strip.set_pan_value}
+
+        kind = strip.strip_kind
+        sync = False
+
+        if kind == "wide_stereo":
+            # Wide stereo strips send the left channel's MIDI commands
+            mappings = self._strip_mappings(section, strip.left_num)
+        elif kind == "stereo_half" and strip.stereo_partner_strip:
+            # For stereo pairs, both channels send the LEFT channel's MIDI commands and mirror each other
+            key = strip.scribble_key
             left_key = key if self.mono_stereo_manager.is_stereo_left(key) else self.mono_stereo_manager.get_stereo_partner(key)
-            if left_key:
-                left_section, left_number = parse_section_and_number(left_key)
-            
-                # Use left channel's MIDI mappings for both channels
-                left_fader_mapping = self.mappings.get((left_section, left_number, 'fader'))
-                if left_fader_mapping:
-                    strip.fader.valueChanged.connect(lambda v, m=left_fader_mapping: self.midi.send_cc(m.midi_channel, m.cc_number, v))
-                    # Also sync to partner
-                    strip.fader.valueChanged.connect(lambda v: strip.sync_to_partner("fader", v))
-
-                if strip.mute:
-                    strip.mute.toggled.connect(strip.mute._on_toggled)
-                    left_mute_mapping = self.mappings.get((left_section, left_number, 'mute'))
-                    if left_mute_mapping:
-                        strip.mute.toggledCC.connect(lambda v, m=left_mute_mapping: self.midi.send_cc(m.midi_channel, m.cc_number, v))
-                        strip.mute.toggledCC.connect(lambda v: strip.sync_to_partner("mute", v))
-
-                if strip.pan:
-                    strip.pan.doubleClicked.connect(strip._pan_reset)
-                    strip.pan.valueChanged.connect(strip._on_pan_changed)
-                    left_pan_mapping = self.mappings.get((left_section, left_number, 'pan'))
-                    if left_pan_mapping:
-                        strip.pan.valueChanged.connect(lambda v, m=left_pan_mapping: self.midi.send_cc(m.midi_channel, m.cc_number, v))
-                        strip.pan.valueChanged.connect(lambda v: strip.sync_to_partner("pan", v))
+            if not left_key:
+                return
+            mappings = self._strip_mappings(*parse_section_and_number(left_key))
+            sync = True
         else:
             # Regular strip wiring
-            fader_mapping = map_for('fader')
-            if fader_mapping:
-                strip.fader.valueChanged.connect(lambda v, m=fader_mapping: self.midi.send_cc(m.midi_channel, m.cc_number, v))
-            
-            if strip.mute:
-                strip.mute.toggled.connect(strip.mute._on_toggled)
-                mute_mapping = map_for('mute')
-                if mute_mapping:
-                    strip.mute.toggledCC.connect(lambda v, m=mute_mapping: self.midi.send_cc(m.midi_channel, m.cc_number, v))
-                    
-            if strip.pan:
-                strip.pan.doubleClicked.connect(strip._pan_reset)
-                strip.pan.valueChanged.connect(strip._on_pan_changed)
-                pan_mapping = map_for('pan')
-                if pan_mapping:
-                    strip.pan.valueChanged.connect(lambda v, m=pan_mapping: self.midi.send_cc(m.midi_channel, m.cc_number, v))
+            mappings = self._strip_mappings(section, number)
+
+        fader_mapping, mute_mapping, pan_mapping = mappings
+        self._connect_control(strip.fader, fader_mapping, "valueChanged",
+                              "valueChanged", strip._sync_fader_to_partner if sync else None)
+        self._connect_control(strip.mute, mute_mapping, "toggledCC",
+                              "toggled", strip._sync_mute_to_partner if sync else None)
+        self._connect_control(strip.pan, pan_mapping, "valueChanged",
+                              "valueChanged", strip._sync_pan_to_partner if sync else None)
+
+    def _connect_control(self, widget, mapping: Optional[MidiMapping], send_signal: str,
+                         sync_signal: str, sync_slot=None):
+        """Wire one strip control to its CC mapping and, for linked pairs, to the partner sync slot"""
+        if widget is None or mapping is None:
+            return
+        # The (channel, cc) this control sends, read back by _send_mapped_cc through sender()
+        widget._cc_key = (mapping.midi_channel, mapping.cc_number)
+        getattr(widget, send_signal).connect(self._send_mapped_cc)
+        if sync_slot is not None:
+            # Both strips live on the GUI thread, so connect directly
+            getattr(widget, sync_signal).connect(sync_slot, QtCore.Qt.DirectConnection)
+
+    @QtCore.pyqtSlot(int)
+    def _send_mapped_cc(self, value: int):
+        """Shared slot for every strip control - the (channel, cc) is stored on the sending widget"""
+        key = self.sender()._cc_key
+        # A drag covers each CC step several times and received values echo back through the widgets
+        if self._last_cc_values.get(key) == value:
+            return
+        self._last_cc_values[key] = value
+        self._pending_cc[key] = value
+        if not self._cc_batch_timer.isActive():
+            self._cc_batch_timer.start()
+
+    @QtCore.pyqtSlot()
+    def _flush_cc_batch(self):
+        self._cc_batch_timer.stop()
+        if self._pending_cc:
+            batch, self._pending_cc = self._pending_cc, {}
+            self.sendCCBatchRequested.emit(batch)
+
+    def _index_mappings(self):
+        """Group mappings by strip so wiring needs one lookup per strip instead of one per control,
+        and index them by (channel << 7) | cc for incoming messages"""
+        self._rev_index: Dict[int, Tuple[str, int, str]] = {
+            (mm.midi_channel << 7) | mm.cc_number: key for key, mm in self.mappings.items()
+        }
+        self._mappings_by_strip: Dict[Tuple[str, int], Tuple[Optional[MidiMapping], Optional[MidiMapping], Optional[MidiMapping]]] = {}
+        for section, number in {(sec, num) for sec, num, _ in self.mappings}:
+            self._mappings_by_strip[(section, number)] = (self.mappings.get((section, number, 'fader')),
+                                                          self.mappings.get((section, number, 'mute')),
+                                                          self.mappings.get((section, number, 'pan')))
+
+    def _strip_mappings(self, section: str, number: int) -> Tuple[Optional[MidiMapping], Optional[MidiMapping], Optional[MidiMapping]]:
+        """(fader, mute, pan) mappings for a strip, None where the CSV has no entry"""
+        return self._mappings_by_strip.get((section, number), (None, None, None))
+
+    def _strip_controls(self) -> List[QtWidgets.QWidget]:
+        """Every fader, mute and pan control across the current strips"""
+        return [w for strip in self._all_strips
+                for w in (strip.fader, strip.mute, strip.pan) if w is not None]
+
+    @contextmanager
+    def _bulk(self, widgets):
+        """Block signals on the given widgets for the duration of a bulk rewire"""
+        widgets = list(widgets)
+        saved = [w.blockSignals(True) for w in widgets]
+        try:
+            yield
+        finally:
+            for w, was_blocked in zip(widgets, saved):
+                w.blockSignals(was_blocked)
 
     def _setup_stereo_pairs(self):
         """Setup stereo pair relationships after all strips are created"""
-        if self.settings.get('stereo_display_mode') != 'linked_pair':
+        if self._built_stereo_mode != 'linked_pair':
             return
             
-        # Link channel pairs
-        for (section, number), strip in self.channel_widgets.items():
-            if section == "channel":
-                key = f"Channel {number}"
-                if (hasattr(strip, 'is_stereo_pair') and strip.is_stereo_pair and 
-                    hasattr(strip, 'stereo_partner_num') and strip.stereo_partner_num):
-                    partner_strip = self.channel_widgets.get(("channel", strip.stereo_partner_num))
+        # Only linked pair halves have a partner; the lookup stays within the strip's own section
+        for widgets in self._section_maps.values():
+            for strip in widgets.values():
+                if strip.strip_kind == "stereo_half":
+                    partner_strip = widgets.get(strip.stereo_partner_num)
                     if partner_strip:
                         strip.set_stereo_partner(partner_strip)
-                        
-        # Link bus pairs
-        for number, strip in self.bus_widgets.items():
-            key = f"Bus {number}"
-            if (hasattr(strip, 'is_stereo_pair') and strip.is_stereo_pair and 
-                hasattr(strip, 'stereo_partner_num') and strip.stereo_partner_num):
-                partner_strip = self.bus_widgets.get(strip.stereo_partner_num)
-                if partner_strip:
-                    strip.set_stereo_partner(partner_strip)
-                    
-        # Link aux pairs  
-        for number, strip in self.aux_widgets.items():
-            key = f"Aux {number}"
-            if (hasattr(strip, 'is_stereo_pair') and strip.is_stereo_pair and 
-                hasattr(strip, 'stereo_partner_num') and strip.stereo_partner_num):
-                partner_strip = self.aux_widgets.get(strip.stereo_partner_num)
-                if partner_strip:
-                    strip.set_stereo_partner(partner_strip)
-
-    def _rewire_all_controls(self):
-        for key, strip in self.channel_widgets.items():
-            if isinstance(key, tuple):
-                section, number = key
-                self._wire_strip_controls(section, number, strip)
-            
-        for number, strip in self.bus_widgets.items():
-            self._wire_strip_controls("bus", number, strip)
-            
-        for number, strip in self.aux_widgets.items():
-            self._wire_strip_controls("aux", number, strip)
-            
-        if self.master_widget:
-            self._wire_strip_controls("master", 1, self.master_widget)
 
-    def _load_scribble_strips(self):
-        for key, strip in self.channel_widgets.items():
-            if isinstance(key, tuple):
-                section, number = key
-                scribble_key = f"Channel {number}"
-            else:
-                scribble_key = f"Channel {key}"
-            text = self.scribble_manager.get_scribble_text(scribble_key)
-            strip.set_scribble_text(text)
+    def _wire_stereo_pairs(self):
+        """Wire linked pair halves, which need their partner set first; _build_rows wires every other strip"""
+        for section, widgets in self._section_maps.items():
+            for number, strip in widgets.items():
+                if strip.strip_kind == "stereo_half":
+                    self._wire_strip_controls(section, number, strip)
 
-        for number, strip in self.bus_widgets.items():
-            key = f"Bus {number}"
-            text = self.scribble_manager.get_scribble_text(key)
-            strip.set_scribble_text(text)
-
-        for number, strip in self.aux_widgets.items():
-            key = f"Aux {number}"
-            text = self.scribble_manager.get_scribble_text(key)
-            strip.set_scribble_text(text)
+    def _load_scribble_strips(self):
+        texts = self.scribble_manager.all_texts()
+        for widgets in (self.channel_widgets, self.bus_widgets, self.aux_widgets):
+            for strip in widgets.values():
+                strip.set_scribble_text(texts.get(strip.scribble_key, DEFAULT_SCRIBBLE_TEXT))
 
     def _on_scribble_text_changed(self, key: str, new_text: str):
-        self.scribble_manager.set_scribble_text(key, new_text)
+        # A wide strip commits both of its keys at once, so the file is written after the burst
+        if self.scribble_manager.set_scribble_text(key, new_text, save=False):
+            self._scribble_save_timer.start()
 
     def _on_v_zoom_changed(self, val: int):
         self.v_scale_factor = val / 100.0
         self.v_zoom_value_lbl.setText(f"{val}%")
         self.settings.set('vertical_zoom', val)
-        self._apply_all_scales()
+        if not self._zoom_timer.isActive():
+            self._zoom_timer.start()
 
     def _apply_all_scales(self):
-        for key, strip in self.channel_widgets.items():
-            strip.apply_scale(1.0, self.v_scale_factor)
-        for strip in self.bus_widgets.values():
-            strip.apply_scale(1.0, self.v_scale_factor)
-        if self.master_widget:
-            self.master_widget.apply_scale(1.0, self.v_scale_factor)
-        for strip in self.aux_widgets.values():
-            strip.apply_scale(1.0, self.v_scale_factor)
-        # Reapply master strip background color after scaling
-        self._apply_master_strip_background_color()
-
-    def on_midi_cc(self, channel_1: int, cc: int, value: int):
-        if not hasattr(self, "_rev_index"):
-            self._rev_index = {}
-            for key, mm in self.mappings.items():
-                self._rev_index[(mm.midi_channel, mm.cc_number)] = key
-
-        key = self._rev_index.get((channel_1, cc))
-        if not key:
+        if self._applied_v_scale == self.v_scale_factor:
             return
-        section, number, typ = key
-
-        if section == "channel":
-            strip = self.channel_widgets.get((section, number))
+        self._applied_v_scale = self.v_scale_factor
+        self.rows_container.setUpdatesEnabled(False)
+        try:
+            for strip in self._all_strips:
+                strip.apply_scale(1.0, self.v_scale_factor)
+        finally:
+            self.rows_container.setUpdatesEnabled(True)
+        # Reapply master strip background color once the zoom settles
+        self._master_bg_timer.start()
+
+    def _index_rx_targets(self):
+        """Resolve every mapped (channel << 7) | cc to the setter of the strip currently showing it.
+        
+        Rebuilt whenever the strips are, so on_midi_cc needs a single lookup per message."""
+        self._rx_setters: Dict[int, object] = {}
+        for packed, (section, number, typ) in self._rev_index.items():
+            if section == "master":
+                strip = self.master_widget
+            else:
+                widgets = self._section_maps.get(section)
+                if widgets is None:
+                    continue
+                # A wide stereo strip is registered under its left number only
+                strip = widgets.get(number) or self._wide_by_right.get((section, number))
             if not strip:
-                channel_key = f"Channel {number}"
-                if self.mono_stereo_manager.is_stereo_right(channel_key):
-                    left_channel_key = self.mono_stereo_manager.get_stereo_partner(channel_key)
-                    if left_channel_key:
-                        left_number = int(left_channel_key.split()[1])
-                        strip = self.channel_widgets.get((section, left_number))
-                
-                if not strip:
-                    return
-        elif section == "bus":
-            strip = self.bus_widgets.get(number)
-        elif section == "aux":
-            strip = self.aux_widgets.get(number)
-        elif section == "master":
-            strip = self.master_widget
-        else:
-            strip = None
-            
-        if not strip:
-            return
-        
-        if typ == "fader":
-            strip.set_fader_value(value)
-        elif typ == "mute":
-            strip.set_mute_value(value >= 64)
-        elif typ == "pan":
-            strip.set_pan_value(value)
+                continue
+            setter = strip._midi_setters.get(typ)
+            if setter:
+                self._rx_setters[packed] = setter
 
+    @QtCore.pyqtSlot(int, int, int)
+    def on_midi_cc(self, channel_1: int, cc: int, value: int):
+        self._last_cc_values[(channel_1, cc)] = value
+        setter = self._rx_setters.get((channel_1 << 7) | cc)
+        if setter:
+            setter(value)
 
     def _show_settings_dialog(self):
         """Show the main settings dialog"""
@@ -4108,8 +4008,9 @@ class MixerWindow(QtWidgets.QMainWindow):
     def mousePressEvent(self, event):
         """Handle right-click on background areas"""
         if event.button() == QtCore.Qt.RightButton:
-            menu = ContextColorMenu("background", self.color_manager, self)
-            menu.exec_(event.globalPos())
+            if self._bg_menu is None:
+                self._bg_menu = ContextColorMenu("background", self.color_manager, self)
+            self._bg_menu.exec_(event.globalPos())
             return
         
         super().mousePressEvent(event)